@@ -5,10 +5,17 @@ This module contains all the reusable business logic that's independent
 of the deployment platform (local, GitHub Actions, AWS Lambda, etc.).
 """
 
+import importlib
+
 from src.core.config import validate_config, get_db_config
-from src.core.fetcher import JobFetcher
 from src.core.storage import get_storage
-from src.core.notifier import EmailNotifier
+
+# Imported on first access (PEP 562) so entry points that never fetch or
+# send email don't pay for importing requests/smtplib
+_LAZY_EXPORTS = {
+    'JobFetcher': 'src.core.fetcher',
+    'EmailNotifier': 'src.core.notifier',
+}
 
 __all__ = [
     'validate_config',
@@ -17,3 +24,10 @@ __all__ = [
     'get_storage',
     'EmailNotifier'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name])
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
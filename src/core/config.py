@@ -5,35 +5,82 @@ Supports both local (.env file) and cloud (environment variables) configuration.
 """
 
 import os
-from typing import List
-from dotenv import load_dotenv
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Optional, Tuple
 
-# Load .env file if it exists (for local development)
-load_dotenv()
 
-# Email configuration
-EMAIL_SENDER = os.getenv('EMAIL_SENDER')
-EMAIL_PASSWORD = os.getenv('EMAIL_PASSWORD')
-EMAIL_RECIPIENT = os.getenv('EMAIL_RECIPIENT')
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """
+    Load variables from a .env file into the environment, once per process.
+    
+    Skipped on AWS Lambda, where configuration comes from the function's
+    environment variables and there is no .env file to search for.
+    """
+    if os.getenv('LAMBDA_TASK_ROOT'):
+        return
+    
+    from dotenv import load_dotenv
+    load_dotenv()
 
-# Adzuna API configuration
-ADZUNA_APP_ID = os.getenv('ADZUNA_APP_ID')
-ADZUNA_API_KEY = os.getenv('ADZUNA_API_KEY')
 
-# Job search configuration
-SEARCH_KEYWORDS = os.getenv('SEARCH_KEYWORDS', 'software engineer intern')
-SEARCH_LOCATIONS = os.getenv('SEARCH_LOCATIONS', 'United States').split(',')
-MAX_DAYS_OLD = int(os.getenv('MAX_DAYS_OLD', '7'))
+@dataclass(frozen=True)
+class Settings:
+    """Snapshot of all configuration values, read from the environment."""
+    
+    # Email configuration
+    EMAIL_SENDER: Optional[str]
+    EMAIL_PASSWORD: Optional[str]
+    EMAIL_RECIPIENT: Optional[str]
+    
+    # Adzuna API configuration
+    ADZUNA_APP_ID: Optional[str]
+    ADZUNA_API_KEY: Optional[str]
+    
+    # Job search configuration
+    SEARCH_KEYWORDS: str
+    SEARCH_LOCATIONS: Tuple[str, ...]
+    MAX_DAYS_OLD: int
+    MAX_PAGES: int  # Result pages per location
+    
+    # Database configuration
+    # Options: 'sqlite' or 'dynamodb'
+    DB_TYPE: str
+    DB_PATH: str
+    
+    # AWS configuration (for future Lambda deployment)
+    AWS_REGION: str
+    DYNAMODB_TABLE: str
+    S3_BUCKET: str  # For SQLite persistence in Lambda
 
-# Database configuration
-# Options: 'sqlite' or 'dynamodb'
-DB_TYPE = os.getenv('DB_TYPE', 'sqlite')
-DB_PATH = os.getenv('DB_PATH', 'jobs.db')
 
-# AWS configuration (for future Lambda deployment)
-AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
-DYNAMODB_TABLE = os.getenv('DYNAMODB_TABLE', 'job-tracker')
-S3_BUCKET = os.getenv('S3_BUCKET', '')  # For SQLite persistence in Lambda
+@lru_cache(maxsize=1)
+def settings() -> Settings:
+    """
+    Get the configuration, reading environment variables on first call.
+    
+    Call settings.cache_clear() to pick up changed environment variables.
+    """
+    # Load .env file if it exists (for local development)
+    load_env()
+    
+    return Settings(
+        EMAIL_SENDER=os.getenv('EMAIL_SENDER'),
+        EMAIL_PASSWORD=os.getenv('EMAIL_PASSWORD'),
+        EMAIL_RECIPIENT=os.getenv('EMAIL_RECIPIENT'),
+        ADZUNA_APP_ID=os.getenv('ADZUNA_APP_ID'),
+        ADZUNA_API_KEY=os.getenv('ADZUNA_API_KEY'),
+        SEARCH_KEYWORDS=os.getenv('SEARCH_KEYWORDS', 'software engineer intern'),
+        SEARCH_LOCATIONS=tuple(os.getenv('SEARCH_LOCATIONS', 'United States').split(',')),
+        MAX_DAYS_OLD=int(os.getenv('MAX_DAYS_OLD', '7')),
+        MAX_PAGES=int(os.getenv('MAX_PAGES', '1')),
+        DB_TYPE=os.getenv('DB_TYPE', 'sqlite'),
+        DB_PATH=os.getenv('DB_PATH', 'jobs.db'),
+        AWS_REGION=os.getenv('AWS_REGION', 'us-east-1'),
+        DYNAMODB_TABLE=os.getenv('DYNAMODB_TABLE', 'job-tracker'),
+        S3_BUCKET=os.getenv('S3_BUCKET', '')
+    )
 
 
 def validate_config() -> bool:
@@ -46,12 +93,13 @@ def validate_config() -> bool:
     Raises:
         ValueError if required configuration is missing
     """
+    cfg = settings()
     required = {
-        'EMAIL_SENDER': EMAIL_SENDER,
-        'EMAIL_PASSWORD': EMAIL_PASSWORD,
-        'EMAIL_RECIPIENT': EMAIL_RECIPIENT,
-        'ADZUNA_APP_ID': ADZUNA_APP_ID,
-        'ADZUNA_API_KEY': ADZUNA_API_KEY
+        'EMAIL_SENDER': cfg.EMAIL_SENDER,
+        'EMAIL_PASSWORD': cfg.EMAIL_PASSWORD,
+        'EMAIL_RECIPIENT': cfg.EMAIL_RECIPIENT,
+        'ADZUNA_APP_ID': cfg.ADZUNA_APP_ID,
+        'ADZUNA_API_KEY': cfg.ADZUNA_API_KEY
     }
     
     missing = [key for key, value in required.items() if not value]
@@ -67,16 +115,24 @@ def validate_config() -> bool:
 
 def get_db_config() -> dict:
     """Get database configuration based on DB_TYPE."""
-    if DB_TYPE == 'sqlite':
+    cfg = settings()
+    if cfg.DB_TYPE == 'sqlite':
         return {
             'type': 'sqlite',
-            'path': DB_PATH
+            'path': cfg.DB_PATH
         }
-    elif DB_TYPE == 'dynamodb':
+    elif cfg.DB_TYPE == 'dynamodb':
         return {
             'type': 'dynamodb',
-            'table_name': DYNAMODB_TABLE,
-            'region': AWS_REGION
+            'table_name': cfg.DYNAMODB_TABLE,
+            'region': cfg.AWS_REGION
         }
     else:
-        raise ValueError(f"Unknown DB_TYPE: {DB_TYPE}")
+        raise ValueError(f"Unknown DB_TYPE: {cfg.DB_TYPE}")
+
+
+def __getattr__(name: str):
+    """Resolve the old module-level constants (e.g. config.DB_PATH) lazily."""
+    if name in {field.name for field in fields(Settings)}:
+        return getattr(settings(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
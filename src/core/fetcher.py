@@ -4,45 +4,97 @@ Job fetching module - handles API calls to job aggregation services.
 Currently supports Adzuna API, but can be extended to support other sources.
 """
 
+import logging
+import math
+import threading
 import requests
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional, Sequence
 from src.core import config
 
+try:
+    # Optional: orjson parses API responses several times faster
+    import orjson as json_parser
+except ImportError:
+    import json as json_parser
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent API requests
+MAX_WORKERS = 8
+
+RESULTS_PER_PAGE = 50
+
 
 class JobFetcher:
     """Fetches job postings from external APIs."""
     
     def __init__(self):
-        self.app_id = config.ADZUNA_APP_ID
-        self.api_key = config.ADZUNA_API_KEY
+        settings = config.settings()
+        self.app_id = settings.ADZUNA_APP_ID
+        self.api_key = settings.ADZUNA_API_KEY
         self.base_url = "https://api.adzuna.com/v1/api/jobs"
+        # Shared across calls (and threads) so connections get reused
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_WORKERS,
+            # 429 is not retried: it means the API quota is used up, and
+            # retrying would only spend more of it
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504]
+            )
+        ))
+        # Location and page fetches nest, so cap in-flight requests here
+        # to keep them within the connection pool
+        self._request_slots = threading.BoundedSemaphore(MAX_WORKERS)
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self.session.close()
+    
+    def __enter__(self) -> "JobFetcher":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def fetch_jobs(
         self, 
         keywords: str, 
         country: str = "us", 
         location: Optional[str] = None, 
-        max_days_old: int = 7
+        max_days_old: int = 7,
+        max_pages: Optional[int] = None
     ) -> List[Dict]:
         """
         Fetch jobs from Adzuna API.
         
+        The first page is fetched on its own to learn the total result
+        count; any remaining pages are then fetched concurrently.
+        
         Args:
             keywords: Search keywords (e.g., "software engineer intern")
             country: Country code (default: "us")
             location: Specific location filter (optional)
             max_days_old: Only return jobs posted in last N days
+            max_pages: Maximum result pages to fetch (default: MAX_PAGES setting)
         
         Returns:
             List of job dictionaries with standardized fields
         """
-        url = f"{self.base_url}/{country}/search/1"
+        if max_pages is None:
+            max_pages = config.settings().MAX_PAGES
         
         params = {
             'app_id': self.app_id,
             'app_key': self.api_key,
             'what': keywords,
-            'results_per_page': 50,
+            'results_per_page': RESULTS_PER_PAGE,
             'content-type': 'application/json',
             'max_days_old': max_days_old
         }
@@ -51,25 +103,50 @@ class JobFetcher:
             params['where'] = location
         
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            jobs = data.get('results', [])
-            
-            print(f"✓ Fetched {len(jobs)} jobs from Adzuna")
-            
-            # Transform to standardized format
-            return [self._transform_job(job) for job in jobs]
-            
-        except requests.exceptions.RequestException as e:
-            print(f"✗ Error fetching jobs: {e}")
+            data = self._fetch_page(country, 1, params)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error("✗ Error fetching jobs: %s", e)
             return []
+        
+        jobs = data.get('results', [])
+        
+        num_pages = min(
+            math.ceil(data.get('count', 0) / RESULTS_PER_PAGE), 
+            max_pages
+        )
+        if num_pages > 1:
+            def fetch_page(page: int) -> List[Dict]:
+                try:
+                    return self._fetch_page(country, page, params).get('results', [])
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    logger.warning("✗ Error fetching page %d: %s", page, e)
+                    return []
+            
+            workers = min(MAX_WORKERS, num_pages - 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for page_jobs in executor.map(fetch_page, range(2, num_pages + 1)):
+                    jobs.extend(page_jobs)
+        
+        logger.debug("✓ Fetched %d jobs from Adzuna", len(jobs))
+        
+        # Transform to standardized format
+        return [self._transform_job(job) for job in jobs]
+    
+    def _fetch_page(self, country: str, page: int, params: Dict) -> Dict:
+        """Fetch one page of search results and return the decoded JSON."""
+        url = f"{self.base_url}/{country}/search/{page}"
+        
+        with self._request_slots:
+            response = self.session.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        
+        # Parse the raw bytes directly; invalid JSON raises ValueError
+        return json_parser.loads(response.content)
     
     def fetch_all_locations(
         self, 
         keywords: str, 
-        locations: List[str], 
+        locations: Sequence[str], 
         max_days_old: int = 7
     ) -> List[Dict]:
         """
@@ -83,25 +160,33 @@ class JobFetcher:
         Returns:
             Combined list of unique jobs from all locations
         """
-        all_jobs = []
-        seen_ids = set()
+        if not locations:
+            return []
         
-        for location in locations:
-            print(f"  Searching in: {location}")
-            jobs = self.fetch_jobs(
+        def fetch_location(location: str) -> List[Dict]:
+            logger.debug("  Searching in: %s", location)
+            return self.fetch_jobs(
                 keywords, 
                 location=location, 
                 max_days_old=max_days_old
             )
-            
-            # Deduplicate by job ID
+        
+        # Requests are I/O bound, so run one per location concurrently
+        workers = min(MAX_WORKERS, len(locations))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fetch_location, locations))
+        
+        # Deduplicate by job ID, keeping the first occurrence
+        unique_jobs = {}
+        for jobs in results:
             for job in jobs:
-                if job['id'] not in seen_ids:
-                    all_jobs.append(job)
-                    seen_ids.add(job['id'])
+                unique_jobs.setdefault(job['id'], job)
         
-        print(f"✓ Total unique jobs found: {len(all_jobs)}")
-        return all_jobs
+        logger.info(
+            "✓ Total unique jobs found: %d (%d location(s))", 
+            len(unique_jobs), len(locations)
+        )
+        return list(unique_jobs.values())
     
     def _transform_job(self, raw_job: Dict) -> Dict:
         """
@@ -116,7 +201,7 @@ class JobFetcher:
             'location': raw_job['location']['display_name'],
             'url': raw_job['redirect_url'],
             'description': raw_job.get('description', ''),
-            'posted_date': raw_job['created'],
+            'posted_date': raw_job.get('created') or '',
             'salary_min': raw_job.get('salary_min'),
             'salary_max': raw_job.get('salary_max')
         }
@@ -124,10 +209,11 @@ class JobFetcher:
 
 # Test function for standalone execution
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     config.validate_config()
     
-    fetcher = JobFetcher()
-    jobs = fetcher.fetch_jobs("software engineer intern", max_days_old=7)
+    with JobFetcher() as fetcher:
+        jobs = fetcher.fetch_jobs("software engineer intern", max_days_old=7)
     
     print(f"\n📋 Sample jobs:")
     for job in jobs[:3]:
@@ -4,57 +4,232 @@ Notification module - handles sending notifications about new jobs.
 Currently supports email via SMTP, but can be extended for Slack, Discord, etc.
 """
 
+import logging
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import sys
+from email.message import EmailMessage
+from email.policy import SMTP
 from typing import List, Dict
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
+from zoneinfo import ZoneInfo
 from src.core import config
 
+logger = logging.getLogger(__name__)
+
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 465
+
+# SMTP line endings, but a 7-bit clean body (the non-ASCII text is encoded),
+# since smtplib doesn't declare BODY=8BITMIME for 8-bit content
+SMTP_POLICY = SMTP.clone(cte_type='7bit')
+
+# Recipients per message; larger lists are split across several sends
+MAX_RECIPIENTS_PER_MESSAGE = 50
+
+# Gmail limits messages per connection; reconnect after this many
+MAX_MESSAGES_PER_CONNECTION = 100
+
+# Email body separators
+_HEADER_SEP = "=" * 70 + "\n\n"
+_JOB_SEP = "\n" + "-" * 70 + "\n\n"
+_FOOTER = (
+    "\nThis is an automated message from your LinkedIn Job Tracker.\n"
+    "Apply early for the best chances! 🚀"
+)
+
+_format_salary_line = "   Salary: ${:,.0f} - ${:,.0f}\n".format
+
+_TEST_EMAIL_BODY = """
+Hello!
+
+This is a test email from your LinkedIn Job Tracker.
+
+If you're receiving this, your email configuration is working correctly! ✓
+
+The tracker will now send you notifications when new software engineering 
+internship positions are found.
+
+Configuration:
+- Search: Software Engineer Intern positions
+- Frequency: Based on your schedule settings
+- Notification: Email (you're reading it!)
+
+Next steps:
+1. Let it run and collect data
+2. Customize search parameters if needed
+3. Check your email for new job notifications
+
+Happy job hunting! 🚀
+
+---
+LinkedIn Job Tracker
+"""
+
+try:
+    # Optional: C-accelerated ISO 8601 parser
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:
+    if sys.version_info >= (3, 11):
+        # Accepts a trailing 'Z' natively
+        _parse_iso8601 = datetime.fromisoformat
+    else:
+        def _parse_iso8601(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# US Eastern time, switching between EST and EDT with daylight saving
+_EASTERN = ZoneInfo("America/New_York")
+_DATE_FORMAT = '%m/%d/%Y'
+_TIME_12HR_FORMAT = '%I:%M %p'  # 09:51 AM
+_TIME_24HR_FORMAT = '%H:%M'     # 14:51
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(timestamp_str: str) -> str:
+    """
+    Format an ISO 8601 UTC timestamp for display (see EmailNotifier.format_timestamp).
+    
+    Cached because jobs from the same batch often share a posted timestamp.
+    """
+    try:
+        # Parse ISO 8601 timestamp (UTC)
+        dt_utc = _parse_iso8601(timestamp_str)
+        if dt_utc.tzinfo is None:
+            dt_utc = dt_utc.replace(tzinfo=timezone.utc)
+        dt_eastern = dt_utc.astimezone(_EASTERN)
+        
+        # Format: 11/19/2025 - 09:51 AM EST (14:51 UTC)
+        date_str = dt_eastern.strftime(_DATE_FORMAT)
+        time_12hr = dt_eastern.strftime(_TIME_12HR_FORMAT)
+        time_24hr = dt_utc.strftime(_TIME_24HR_FORMAT)
+        zone = dt_eastern.tzname()  # EST or EDT
+        
+        return f"{date_str} - {time_12hr} {zone} ({time_24hr} UTC)"
+    except (ValueError, AttributeError):
+        # Fallback if timestamp parsing fails
+        return timestamp_str
+
 
 class EmailNotifier:
     """Email notification handler using Gmail SMTP."""
     
     def __init__(self):
-        self.sender = config.EMAIL_SENDER
-        self.password = config.EMAIL_PASSWORD
-        self.recipient = config.EMAIL_RECIPIENT
+        settings = config.settings()
+        self.sender = settings.EMAIL_SENDER
+        self.password = settings.EMAIL_PASSWORD
+        # EMAIL_RECIPIENT may be a comma-separated list
+        self.recipients = [
+            address.strip() 
+            for address in (settings.EMAIL_RECIPIENT or '').split(',') 
+            if address.strip()
+        ]
+        self._smtp = None
+        self._messages_sent = 0
+    
+    def __enter__(self) -> "EmailNotifier":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Log out and close the SMTP connection, if one is open."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            # Already dropped by the server; quit() didn't get to close the
+            # socket, so release it here
+            self._smtp.close()
+        self._smtp = None
+    
+    def _get_smtp(self) -> smtplib.SMTP_SSL:
+        """
+        Return the shared SMTP connection, connecting and logging in if needed.
+        
+        An existing connection is health-checked with NOOP and recycled after
+        MAX_MESSAGES_PER_CONNECTION messages.
+        """
+        if self._smtp is not None:
+            if self._messages_sent >= MAX_MESSAGES_PER_CONNECTION:
+                self.close()
+            else:
+                try:
+                    healthy = self._smtp.noop()[0] == 250
+                except (smtplib.SMTPException, OSError):
+                    healthy = False
+                if not healthy:
+                    self._smtp.close()
+                    self._smtp = None
+        
+        if self._smtp is None:
+            server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT)
+            try:
+                server.login(self.sender, self.password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+            self._messages_sent = 0
+        return self._smtp
+    
+    def _send(self, msg: EmailMessage) -> None:
+        """
+        Address and send a message to all recipients.
+        
+        A single recipient goes in To. Several recipients are sent as BCC
+        (addressed To the sender) in batches of MAX_RECIPIENTS_PER_MESSAGE.
+        
+        Raises:
+            ValueError if EMAIL_RECIPIENT contains no addresses
+        """
+        if not self.recipients:
+            raise ValueError("EMAIL_RECIPIENT contains no email addresses")
+        
+        for start in range(0, len(self.recipients), MAX_RECIPIENTS_PER_MESSAGE):
+            batch = self.recipients[start:start + MAX_RECIPIENTS_PER_MESSAGE]
+            
+            del msg['To']
+            del msg['Bcc']
+            if len(self.recipients) == 1:
+                msg['To'] = batch[0]
+            else:
+                msg['To'] = self.sender
+                msg['Bcc'] = ', '.join(batch)
+            
+            self._send_message(msg, batch)
+    
+    def _send_message(self, msg: EmailMessage, to_addrs: List[str]) -> None:
+        """Send over the shared connection, reconnecting once if dropped."""
+        try:
+            self._get_smtp().send_message(msg, to_addrs=to_addrs)
+        except smtplib.SMTPServerDisconnected:
+            self.close()
+            self._get_smtp().send_message(msg, to_addrs=to_addrs)
+        self._messages_sent += 1
     
     def format_timestamp(self, timestamp_str: str) -> str:
         """
-        Convert ISO 8601 timestamp to readable format with EST timezone.
+        Convert ISO 8601 timestamp to readable format in US Eastern time.
         
         Args:
             timestamp_str: ISO 8601 timestamp (e.g., "2025-11-19T14:51:45Z")
         
         Returns:
-            Formatted string: "11/19/2025 - 09:51 EST (14:51 UTC)"
+            Formatted string: "11/19/2025 - 09:51 AM EST (14:51 UTC)"
+            (EDT instead of EST while daylight saving time is in effect)
         """
-        try:
-            # Parse ISO 8601 timestamp (UTC)
-            dt_utc = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            
-            # Convert to EST (UTC-5)
-            # Note: This is a simple offset. For DST handling, use pytz library
-            from datetime import timedelta
-            dt_est = dt_utc - timedelta(hours=5)
-            
-            # Format: 11/19/2025 - 09:51 EST (14:51 UTC)
-            date_str = dt_est.strftime('%m/%d/%Y')
-            time_12hr = dt_est.strftime('%I:%M %p')  # 09:51 AM
-            time_24hr = dt_utc.strftime('%H:%M')     # 14:51
-            
-            return f"{date_str} - {time_12hr} EST ({time_24hr} UTC)"
-        except (ValueError, AttributeError):
-            # Fallback if timestamp parsing fails
-            return timestamp_str
+        return _format_timestamp(timestamp_str)
     
     def format_job_email(self, jobs: List[Dict]) -> str:
         """
         Format jobs into a readable email body.
         
         Args:
-            jobs: List of job dictionaries
+            jobs: List of job dictionaries; each must have a 'posted_date'
+                string (empty if unknown)
             
         Returns:
             Formatted email body as string
@@ -63,41 +238,41 @@ class EmailNotifier:
             return "No new jobs found."
         
         # Sort jobs by posted_date (newest first)
-        sorted_jobs = sorted(
-            jobs, 
-            key=lambda x: x.get('posted_date', ''), 
-            reverse=True
-        )
+        sorted_jobs = sorted(jobs, key=itemgetter('posted_date'), reverse=True)
         
-        body = f"🎯 Found {len(sorted_jobs)} new software engineering internship posting(s)!\n\n"
-        body += "=" * 70 + "\n\n"
+        parts = [
+            f"🎯 Found {len(sorted_jobs)} new software engineering internship posting(s)!\n\n",
+            _HEADER_SEP
+        ]
         
         for i, job in enumerate(sorted_jobs, 1):
-            body += f"{i}. {job['title']}\n"
-            body += f"   Company: {job['company']}\n"
-            body += f"   Location: {job['location']}\n"
-            
             # Add salary if available
-            if job.get('salary_min') and job.get('salary_max'):
-                salary_min = f"${job['salary_min']:,.0f}"
-                salary_max = f"${job['salary_max']:,.0f}"
-                body += f"   Salary: {salary_min} - {salary_max}\n"
-            
-            body += f"   Apply: {job['url']}\n"
+            salary_min = job.get('salary_min')
+            salary_max = job.get('salary_max')
+            if salary_min and salary_max:
+                salary = _format_salary_line(salary_min, salary_max)
+            else:
+                salary = ""
             
             # Format timestamp for readability
             if job.get('posted_date'):
-                formatted_date = self.format_timestamp(job['posted_date'])
-                body += f"   Posted: {formatted_date}\n"
+                posted = self.format_timestamp(job['posted_date'])
             else:
-                body += f"   Posted: N/A\n"
+                posted = "N/A"
             
-            body += "\n" + "-" * 70 + "\n\n"
+            parts.append(
+                f"{i}. {job['title']}\n"
+                f"   Company: {job['company']}\n"
+                f"   Location: {job['location']}\n"
+                f"{salary}"
+                f"   Apply: {job['url']}\n"
+                f"   Posted: {posted}\n"
+                f"{_JOB_SEP}"
+            )
         
-        body += "\nThis is an automated message from your LinkedIn Job Tracker.\n"
-        body += "Apply early for the best chances! 🚀"
+        parts.append(_FOOTER)
         
-        return body
+        return "".join(parts)
     
     def send_notification(self, jobs: List[Dict]) -> bool:
         """
@@ -110,31 +285,30 @@ class EmailNotifier:
             True if email sent successfully, False otherwise
         """
         if not jobs:
-            print("  No new jobs to notify about")
+            logger.info("  No new jobs to notify about")
             return False
         
         try:
             # Create message
-            msg = MIMEMultipart()
+            msg = EmailMessage(policy=SMTP_POLICY)
             msg['Subject'] = f"🚀 {len(jobs)} New SWE Intern Posting(s) Found!"
             msg['From'] = self.sender
-            msg['To'] = self.recipient
             
-            # Format email body
-            body = self.format_job_email(jobs)
-            msg.attach(MIMEText(body, 'plain'))
+            # Format email body; not kept in a local, so the string can be
+            # freed as soon as the message holds its encoded copy
+            msg.set_content(self.format_job_email(jobs))
             
             # Send email via Gmail SMTP
-            with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-                server.login(self.sender, self.password)
-                server.send_message(msg)
+            self._send(msg)
             
-            print(f"✓ Email sent to {self.recipient}")
-            print(f"  Notified about {len(jobs)} new job(s)")
+            logger.info(
+                "✓ Email sent to %s (%d new job(s))", 
+                ', '.join(self.recipients), len(jobs)
+            )
             return True
             
         except Exception as e:
-            print(f"✗ Failed to send email: {e}")
+            logger.error("✗ Failed to send email: %s", e)
             return False
     
     def send_test_email(self) -> bool:
@@ -145,58 +319,30 @@ class EmailNotifier:
             True if test email sent successfully, False otherwise
         """
         try:
-            msg = MIMEMultipart()
+            msg = EmailMessage(policy=SMTP_POLICY)
             msg['Subject'] = "✅ Job Tracker Setup Complete"
             msg['From'] = self.sender
-            msg['To'] = self.recipient
-            
-            body = """
-Hello!
-
-This is a test email from your LinkedIn Job Tracker.
-
-If you're receiving this, your email configuration is working correctly! ✓
-
-The tracker will now send you notifications when new software engineering 
-internship positions are found.
-
-Configuration:
-- Search: Software Engineer Intern positions
-- Frequency: Based on your schedule settings
-- Notification: Email (you're reading it!)
-
-Next steps:
-1. Let it run and collect data
-2. Customize search parameters if needed
-3. Check your email for new job notifications
-
-Happy job hunting! 🚀
-
----
-LinkedIn Job Tracker
-            """
+            msg.set_content(_TEST_EMAIL_BODY)
             
-            msg.attach(MIMEText(body, 'plain'))
+            self._send(msg)
             
-            with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-                server.login(self.sender, self.password)
-                server.send_message(msg)
-            
-            print(f"✓ Test email sent successfully to {self.recipient}")
+            logger.info("✓ Test email sent successfully to %s", ', '.join(self.recipients))
             return True
             
         except Exception as e:
-            print(f"✗ Failed to send test email: {e}")
-            print("  Check your email credentials and app password")
+            logger.error(
+                "✗ Failed to send test email: %s\n"
+                "  Check your email credentials and app password", e
+            )
             return False
 
 
 # Test function for standalone execution
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     config.validate_config()
     
-    notifier = EmailNotifier()
-    
-    # Send test email
-    print("Sending test email...")
-    notifier.send_test_email()
+    with EmailNotifier() as notifier:
+        # Send test email
+        print("Sending test email...")
+        notifier.send_test_email()
@@ -5,21 +5,44 @@ Supports both SQLite (local/GitHub Actions) and DynamoDB (AWS Lambda).
 This abstraction makes it easy to swap databases without changing business logic.
 """
 
+import logging
 import sqlite3
-from typing import List, Dict, Protocol
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, List, Dict, Set, Protocol
 from datetime import datetime
 from src.core import config
 
+logger = logging.getLogger(__name__)
+
+# Bump when the jobs table layout changes; see SQLiteStorage._migrate_schema()
+SCHEMA_VERSION = 2
+
+# SQLite's default limit on bound parameters in older builds
+MAX_SQL_VARIABLES = 999
+
+JOB_COLUMNS = (
+    'job_id, title, company, location, url, description, posted_date, '
+    'salary_min, salary_max, first_seen, notified'
+)
+
 
 class StorageInterface(Protocol):
     """Interface that all storage implementations must follow."""
     
     def init_database(self) -> None: ...
     def is_new_job(self, job_id: str) -> bool: ...
+    def filter_new_ids(self, job_ids: List[str]) -> Set[str]: ...
+    def load_known_ids(self) -> Set[str]: ...
     def add_job(self, job: Dict) -> None: ...
+    def add_jobs(self, jobs: List[Dict]) -> int: ...
     def mark_as_notified(self, job_id: str) -> None: ...
+    def mark_as_notified_many(self, job_ids: List[str]) -> None: ...
+    def iter_jobs(self) -> Iterator[Dict]: ...
     def get_all_jobs(self) -> List[Dict]: ...
+    def get_recent_jobs(self, limit: int = 5) -> List[Dict]: ...
     def get_job_count(self) -> int: ...
+    def close(self) -> None: ...
 
 
 class SQLiteStorage:
@@ -27,15 +50,101 @@ class SQLiteStorage:
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        # One connection for the lifetime of the storage object. Autocommit
+        # mode (isolation_level=None); batched writes use _transaction().
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        # IDs known to be stored; lets repeat lookups (e.g. on a warm Lambda)
+        # skip SQLite entirely
+        self._known_ids: Set[str] = set()
+        # True once load_known_ids() has read every stored ID
+        self._all_ids_loaded = False
         self.init_database()
     
     def init_database(self) -> None:
         """Initialize the database with the jobs table."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
+        
+        # WAL is persistent on the database file; the rest are per-connection
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-20000')
+        
+        self._migrate_schema()
+        
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_jobs_first_seen '
+            'ON jobs(first_seen DESC)'
+        )
+        # Serve view_database.py's listings, which sort and page by
+        # (posted_date, first_seen, job_id)
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_jobs_posted '
+            'ON jobs(posted_date DESC, first_seen DESC, job_id DESC)'
+        )
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_jobs_notified_posted '
+            'ON jobs(notified, posted_date DESC, first_seen DESC, job_id DESC)'
+        )
+        # Superseded by idx_jobs_notified_posted
+        cursor.execute('DROP INDEX IF EXISTS idx_jobs_notified_first_seen')
+        
+        # Counted once here, then kept up to date by add_jobs()
+        cursor.execute('SELECT COUNT(*) FROM jobs')
+        self._count = cursor.fetchone()[0]
+        
+        logger.info("✓ Database initialized at %s", self.db_path)
+    
+    def _migrate_schema(self) -> None:
+        """
+        Create the jobs table, or upgrade an older one, per PRAGMA user_version.
+        
+        Version 1 stores jobs WITHOUT ROWID: job_id is the clustered primary
+        key, so there is no separate rowid B-tree plus job_id index to keep.
+        
+        Version 2 stores a missing posted_date as '' rather than NULL, so the
+        viewer's (posted_date, first_seen, job_id) paging comparison covers
+        every row, and rebuilds the listing indexes to include job_id.
+        """
+        cursor = self._conn.cursor()
+        cursor.execute('PRAGMA user_version')
+        version = cursor.fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs'"
+        )
+        has_old_table = cursor.fetchone() is not None
+        
+        with self._transaction() as cursor:
+            if version < 1:
+                self._create_jobs_table(cursor, copy_old=has_old_table)
+            
+            if version < 2:
+                cursor.execute(
+                    "UPDATE jobs SET posted_date = '' WHERE posted_date IS NULL"
+                )
+                # Recreated with job_id by init_database()
+                cursor.execute('DROP INDEX IF EXISTS idx_jobs_posted')
+                cursor.execute('DROP INDEX IF EXISTS idx_jobs_notified_posted')
+            
+            cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        
+        if has_old_table:
+            logger.info("✓ Migrated jobs table to schema version %d", SCHEMA_VERSION)
+    
+    def _create_jobs_table(self, cursor: sqlite3.Cursor, copy_old: bool) -> None:
+        """Create the version 1 jobs table, copying rows from an older one."""
+        if copy_old:
+            cursor.execute('ALTER TABLE jobs RENAME TO jobs_old')
         
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS jobs (
+            CREATE TABLE jobs (
                 job_id TEXT PRIMARY KEY,
                 title TEXT NOT NULL,
                 company TEXT NOT NULL,
@@ -46,89 +155,182 @@ class SQLiteStorage:
                 salary_min REAL,
                 salary_max REAL,
                 first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                notified BOOLEAN DEFAULT 0
-            )
+                notified INTEGER DEFAULT 0
+            ) WITHOUT ROWID
         ''')
         
-        conn.commit()
-        conn.close()
-        print(f"✓ Database initialized at {self.db_path}")
+        if copy_old:
+            cursor.execute(
+                f'INSERT INTO jobs ({JOB_COLUMNS}) '
+                f'SELECT {JOB_COLUMNS} FROM jobs_old'
+            )
+            # Also drops indexes, which moved to jobs_old with the rename
+            cursor.execute('DROP TABLE jobs_old')
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run several statements in one transaction (one commit/fsync)."""
+        cursor = self._conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            yield cursor
+        except BaseException:
+            cursor.execute('ROLLBACK')
+            raise
+        cursor.execute('COMMIT')
     
     def is_new_job(self, job_id: str) -> bool:
         """Check if a job ID is new (not in database)."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
         cursor.execute('SELECT job_id FROM jobs WHERE job_id = ?', (job_id,))
         result = cursor.fetchone()
         
-        conn.close()
         return result is None
     
+    def filter_new_ids(self, job_ids: List[str]) -> Set[str]:
+        """
+        Return the subset of job IDs that are not yet in the database.
+        
+        IDs already seen by this instance are answered from memory; the rest
+        are checked with IN queries of up to MAX_SQL_VARIABLES IDs each,
+        instead of one is_new_job() lookup per ID. After load_known_ids(),
+        no queries are needed at all.
+        """
+        candidates = set(job_ids) - self._known_ids
+        if not candidates or self._all_ids_loaded:
+            return candidates
+        
+        candidates = list(candidates)
+        cursor = self._conn.cursor()
+        existing = set()
+        for start in range(0, len(candidates), MAX_SQL_VARIABLES):
+            chunk = candidates[start:start + MAX_SQL_VARIABLES]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f'SELECT job_id FROM jobs WHERE job_id IN ({placeholders})',
+                chunk
+            )
+            existing.update(row[0] for row in cursor.fetchall())
+        self._known_ids |= existing
+        
+        return set(candidates) - existing
+    
+    def load_known_ids(self) -> Set[str]:
+        """
+        Read every stored job ID into memory with a single scan.
+        
+        Suits long-lived instances (e.g. a warm Lambda): later
+        filter_new_ids() calls are answered without touching SQLite. Assumes
+        this instance is the only writer, as add_jobs() keeps the set current.
+        
+        Returns:
+            Set of all stored job IDs
+        """
+        cursor = self._conn.execute('SELECT job_id FROM jobs')
+        self._known_ids = {row[0] for row in cursor}
+        self._all_ids_loaded = True
+        
+        return set(self._known_ids)
+    
     def add_job(self, job: Dict) -> None:
         """Add a new job to the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.add_jobs([job])
+    
+    def add_jobs(self, jobs: List[Dict]) -> int:
+        """
+        Add several jobs to the database in a single transaction.
         
-        try:
-            cursor.execute('''
-                INSERT INTO jobs 
-                (job_id, title, company, location, url, description, 
-                 posted_date, salary_min, salary_max)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+        Jobs that already exist are skipped.
+        
+        Returns:
+            Number of jobs actually inserted
+        """
+        if not jobs:
+            return 0
+        
+        rows = [
+            (
                 job['id'],
                 job['title'],
                 job['company'],
                 job.get('location', ''),
                 job['url'],
                 job.get('description', ''),
-                job.get('posted_date', ''),
+                job.get('posted_date') or '',
                 job.get('salary_min'),
                 job.get('salary_max')
-            ))
-            
-            conn.commit()
-            print(f"  + Added: {job['title']} at {job['company']}")
-        except sqlite3.IntegrityError:
-            # Job already exists (shouldn't happen if is_new_job is checked)
-            pass
-        finally:
-            conn.close()
+            )
+            for job in jobs
+        ]
+        
+        with self._transaction() as cursor:
+            cursor.executemany('''
+                INSERT OR IGNORE INTO jobs 
+                (job_id, title, company, location, url, description, 
+                 posted_date, salary_min, salary_max)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            inserted = cursor.rowcount
+        
+        self._known_ids.update(row[0] for row in rows)
+        self._count += inserted
+        logger.info("  + Added %d job(s) to the database", inserted)
+        return inserted
     
     def mark_as_notified(self, job_id: str) -> None:
         """Mark a job as having been notified."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.mark_as_notified_many([job_id])
+    
+    def mark_as_notified_many(self, job_ids: List[str]) -> None:
+        """Mark several jobs as notified in a single transaction."""
+        if not job_ids:
+            return
         
-        cursor.execute('UPDATE jobs SET notified = 1 WHERE job_id = ?', (job_id,))
-        conn.commit()
-        conn.close()
+        with self._transaction() as cursor:
+            cursor.executemany(
+                'UPDATE jobs SET notified = 1 WHERE job_id = ?',
+                [(job_id,) for job_id in job_ids]
+            )
     
-    def get_all_jobs(self) -> List[Dict]:
-        """Get all jobs from database."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    def iter_jobs(self) -> Iterator[Dict]:
+        """
+        Yield all jobs from database, newest first, one row at a time.
+        
+        Unlike get_all_jobs(), rows are read from the cursor as they are
+        consumed rather than all being held in memory at once.
+        """
+        cursor = self._conn.cursor()
+        cursor.row_factory = sqlite3.Row
         
         cursor.execute('SELECT * FROM jobs ORDER BY first_seen DESC')
-        rows = cursor.fetchall()
+        for row in cursor:
+            yield dict(row)
+    
+    def get_all_jobs(self) -> List[Dict]:
+        """Get all jobs from database."""
+        return list(self.iter_jobs())
+    
+    def get_recent_jobs(self, limit: int = 5) -> List[Dict]:
+        """Get the most recently added jobs (title, company, first_seen only)."""
+        cursor = self._conn.cursor()
+        cursor.row_factory = sqlite3.Row
         
-        jobs = [dict(row) for row in rows]
-        conn.close()
+        cursor.execute(
+            'SELECT title, company, first_seen FROM jobs '
+            'ORDER BY first_seen DESC LIMIT ?',
+            (limit,)
+        )
         
-        return jobs
+        return [dict(row) for row in cursor.fetchall()]
     
     def get_job_count(self) -> int:
         """Get total number of jobs tracked."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*) FROM jobs')
-        count = cursor.fetchone()[0]
-        
-        conn.close()
-        return count
+        return self._count
 
 
 class DynamoDBStorage:
@@ -157,29 +359,61 @@ class DynamoDBStorage:
         # TODO: DynamoDB GetItem operation
         raise NotImplementedError()
     
+    def filter_new_ids(self, job_ids: List[str]) -> Set[str]:
+        # TODO: DynamoDB BatchGetItem operation
+        raise NotImplementedError()
+    
+    def load_known_ids(self) -> Set[str]:
+        # TODO: DynamoDB Scan projecting job_id
+        raise NotImplementedError()
+    
     def add_job(self, job: Dict) -> None:
         # TODO: DynamoDB PutItem operation
         raise NotImplementedError()
     
+    def add_jobs(self, jobs: List[Dict]) -> int:
+        # TODO: DynamoDB BatchWriteItem operation
+        raise NotImplementedError()
+    
     def mark_as_notified(self, job_id: str) -> None:
         # TODO: DynamoDB UpdateItem operation
         raise NotImplementedError()
     
+    def mark_as_notified_many(self, job_ids: List[str]) -> None:
+        # TODO: DynamoDB UpdateItem per job (no batch update API)
+        raise NotImplementedError()
+    
+    def iter_jobs(self) -> Iterator[Dict]:
+        # TODO: DynamoDB paginated Scan operation
+        raise NotImplementedError()
+    
     def get_all_jobs(self) -> List[Dict]:
         # TODO: DynamoDB Scan operation
         raise NotImplementedError()
     
+    def get_recent_jobs(self, limit: int = 5) -> List[Dict]:
+        # TODO: DynamoDB Query on a first_seen index
+        raise NotImplementedError()
+    
     def get_job_count(self) -> int:
         # TODO: DynamoDB Scan with count
         raise NotImplementedError()
+    
+    def close(self) -> None:
+        # boto3 clients don't hold connections that need closing
+        pass
 
 
+@lru_cache(maxsize=1)
 def get_storage() -> StorageInterface:
     """
     Factory function to get the appropriate storage implementation.
     
     Returns storage instance based on configuration.
     This is the only function you need to call - it handles the switching.
+    
+    The instance is created once per process and shared by later calls.
+    After closing it, call get_storage.cache_clear() to get a fresh one.
     """
     db_config = config.get_db_config()
     
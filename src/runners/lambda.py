@@ -9,6 +9,7 @@ FUTURE IMPLEMENTATION - Not needed for Phase 1 (GitHub Actions)
 
 import os
 import json
+import logging
 from datetime import datetime
 from src.core import (
     validate_config,
@@ -17,6 +18,36 @@ from src.core import (
     EmailNotifier,
     config
 )
+from src.core.storage import StorageInterface
+
+logger = logging.getLogger(__name__)
+
+# The Lambda runtime attaches its own handler to the root logger; only the
+# level needs raising so core modules' INFO messages reach CloudWatch
+logging.getLogger().setLevel(logging.INFO)
+
+# Components are created once per container, during Lambda's init phase, and
+# reused by every warm invocation. An error here fails the init, so Lambda
+# reports it and retries init on the next invocation.
+try:
+    # Validate configuration (using environment variables)
+    validate_config()
+    
+    # Note: If using SQLite on Lambda, you'll need to:
+    # 1. Download from S3 at start
+    # 2. Upload to S3 at end
+    # Or switch to DynamoDB by setting DB_TYPE=dynamodb
+    _STORAGE = get_storage()
+    # Deliberately no _STORAGE.load_known_ids() here: it assumes this
+    # container is the database's only writer for its whole lifetime. With
+    # SQLite synced from S3 per run, or another runner (e.g. GitHub Actions)
+    # writing the same jobs, the preloaded IDs would go stale and already
+    # emailed jobs would be sent again. filter_new_ids() queries instead.
+    _FETCHER = JobFetcher()
+    _NOTIFIER = EmailNotifier()
+except Exception:
+    logger.exception("Error initializing Lambda components")
+    raise
 
 
 def lambda_handler(event, context):
@@ -32,62 +63,12 @@ def lambda_handler(event, context):
     Returns:
         Response dict with status code and results
     """
-    print(f"Job Tracker Lambda triggered at {datetime.now()}")
+    logger.info("Job Tracker Lambda triggered at %s", datetime.now())
     
     try:
-        # Validate configuration (using environment variables)
-        validate_config()
-        
-        # Initialize components
-        # Note: If using SQLite on Lambda, you'll need to:
-        # 1. Download from S3 at start
-        # 2. Upload to S3 at end
-        # Or switch to DynamoDB by setting DB_TYPE=dynamodb
-        
-        storage = get_storage()
-        fetcher = JobFetcher()
-        notifier = EmailNotifier()
-        
-        # Fetch jobs
-        print("Fetching jobs...")
-        jobs = fetcher.fetch_all_locations(
-            keywords=config.SEARCH_KEYWORDS,
-            locations=config.SEARCH_LOCATIONS,
-            max_days_old=config.MAX_DAYS_OLD
-        )
-        
-        # Filter for new jobs
-        print("Checking for new jobs...")
-        new_jobs = []
-        for job in jobs:
-            if storage.is_new_job(job['id']):
-                new_jobs.append(job)
-                storage.add_job(job)
-        
-        # Send notifications
-        if new_jobs:
-            print(f"Sending notification for {len(new_jobs)} new jobs")
-            success = notifier.send_notification(new_jobs)
-            
-            if success:
-                for job in new_jobs:
-                    storage.mark_as_notified(job['id'])
-        
-        # Return success response
-        return {
-            'statusCode': 200,
-            'body': json.dumps({
-                'message': 'Job check complete',
-                'jobs_found': len(jobs),
-                'new_jobs': len(new_jobs),
-                'timestamp': datetime.now().isoformat()
-            })
-        }
-        
+        return _check_jobs(_STORAGE, _FETCHER, _NOTIFIER)
     except Exception as e:
-        print(f"Error in Lambda execution: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in Lambda execution: %s", e)
         
         return {
             'statusCode': 500,
@@ -98,8 +79,54 @@ def lambda_handler(event, context):
         }
 
 
+def _check_jobs(
+    storage: StorageInterface, 
+    fetcher: JobFetcher, 
+    notifier: EmailNotifier
+) -> dict:
+    """Fetch, filter, store and notify; returns the success response."""
+    settings = config.settings()
+    
+    # Fetch jobs
+    logger.info("Fetching jobs...")
+    jobs = fetcher.fetch_all_locations(
+        keywords=settings.SEARCH_KEYWORDS,
+        locations=settings.SEARCH_LOCATIONS,
+        max_days_old=settings.MAX_DAYS_OLD
+    )
+    
+    # Filter for new jobs
+    logger.info("Checking for new jobs...")
+    new_ids = storage.filter_new_ids([job['id'] for job in jobs])
+    new_jobs = [job for job in jobs if job['id'] in new_ids]
+    storage.add_jobs(new_jobs)
+    
+    # Send notifications
+    if new_jobs:
+        logger.info("Sending notification for %d new jobs", len(new_jobs))
+        # Log out after sending; the notifier reconnects on the next run
+        with notifier:
+            success = notifier.send_notification(new_jobs)
+        
+        if success:
+            storage.mark_as_notified_many([job['id'] for job in new_jobs])
+    
+    # Return success response
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': 'Job check complete',
+            'jobs_found': len(jobs),
+            'new_jobs': len(new_jobs),
+            'timestamp': datetime.now().isoformat()
+        })
+    }
+
+
 # For local testing of Lambda handler
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Simulate Lambda event/context
     test_event = {}
     
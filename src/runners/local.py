@@ -11,19 +11,28 @@ The business logic is in src/core, this is just the entry point.
 """
 
 import sys
-import argparse
+import logging
 from datetime import datetime
-from src.core import (
-    validate_config, 
-    JobFetcher, 
-    get_storage, 
-    EmailNotifier,
-    config
-)
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Union
+from src.core import validate_config, get_storage, config
+from src.core.storage import StorageInterface
 
+if TYPE_CHECKING:
+    import argparse
 
-def main():
-    """Main orchestration function."""
+BANNER_RULE = "=" * 60
+STATS_RULE = "=" * 50
+
+
+def parse_args() -> Union[SimpleNamespace, "argparse.Namespace"]:
+    """Parse CLI arguments, skipping argparse entirely for a bare scheduled run."""
+    if len(sys.argv) == 1:
+        return SimpleNamespace(
+            test_email=False, check=False, stats=False, send_all=False
+        )
+    
+    import argparse
     
     parser = argparse.ArgumentParser(
         description='LinkedIn Job Tracker - Find SWE internships'
@@ -48,7 +57,16 @@ def main():
         action='store_true',
         help='Send email with ALL jobs from database'
     )
-    args = parser.parse_args()
+    return parser.parse_args()
+
+
+def main():
+    """Main orchestration function."""
+    
+    args = parse_args()
+    
+    # Core modules report progress via logging; show it inline with our output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     
     # Validate configuration
     try:
@@ -59,27 +77,40 @@ def main():
         print("See .env.example for template.\n")
         sys.exit(1)
     
-    # Initialize components
     storage = get_storage()
-    fetcher = JobFetcher()
-    notifier = EmailNotifier()
+    try:
+        run(args, storage)
+    finally:
+        storage.close()
+        # get_storage() caches its instance; don't hand out the closed one
+        get_storage.cache_clear()
+
+
+def run(args: Union[SimpleNamespace, "argparse.Namespace"], storage: StorageInterface) -> None:
+    """Run the command selected by the CLI arguments against storage."""
+    
+    # Fetcher and notifier are imported only by the branches that use them,
+    # so e.g. --stats doesn't load requests or smtplib
     
     # Handle test email
     if args.test_email:
+        from src.core import EmailNotifier
+        
         print("\n📧 Sending test email...")
-        success = notifier.send_test_email()
+        with EmailNotifier() as notifier:
+            success = notifier.send_test_email()
         sys.exit(0 if success else 1)
     
     # Handle stats
     if args.stats:
         total_jobs = storage.get_job_count()
         print(f"\n📊 Database Statistics")
-        print(f"=" * 50)
+        print(STATS_RULE)
         print(f"Total jobs tracked: {total_jobs}")
         
         if total_jobs > 0:
             print(f"\nRecent jobs:")
-            recent_jobs = storage.get_all_jobs()[:5]
+            recent_jobs = storage.get_recent_jobs(5)
             for job in recent_jobs:
                 print(f"  • {job['title']} at {job['company']}")
                 print(f"    Added: {job['first_seen']}")
@@ -88,32 +119,35 @@ def main():
     
     # Handle send all jobs
     if args.send_all:
-        all_jobs = storage.get_all_jobs()
-        
-        if not all_jobs:
-            print("\n❌ No jobs in database to send.")
-            print("Run the tracker first: python -m src.runners.local\n")
-            sys.exit(1)
-        
-        print(f"\n📧 Sending email with ALL {len(all_jobs)} job(s) from database...")
-        
-        # Transform database format to match notifier format
-        jobs_for_email = []
-        for job in all_jobs:
-            jobs_for_email.append({
+        # Transform database format to match notifier format, streaming rows
+        # so only the converted jobs are held in memory
+        jobs_for_email = [
+            {
                 'id': job['job_id'],
                 'title': job['title'],
                 'company': job['company'],
                 'location': job['location'],
                 'url': job['url'],
                 'description': job.get('description', ''),
-                'posted_date': job.get('posted_date', ''),
+                'posted_date': job.get('posted_date') or '',
                 'salary_min': job.get('salary_min'),
                 'salary_max': job.get('salary_max')
-            })
+            }
+            for job in storage.iter_jobs()
+        ]
+        
+        if not jobs_for_email:
+            print("\n❌ No jobs in database to send.")
+            print("Run the tracker first: python -m src.runners.local\n")
+            sys.exit(1)
+        
+        print(f"\n📧 Sending email with ALL {len(jobs_for_email)} job(s) from database...")
+        
+        from src.core import EmailNotifier
         
         # Notifier will sort by posted_date (newest first)
-        success = notifier.send_notification(jobs_for_email)
+        with EmailNotifier() as notifier:
+            success = notifier.send_notification(jobs_for_email)
         
         if success:
             print(f"✅ Email sent with {len(jobs_for_email)} job(s)!")
@@ -124,22 +158,26 @@ def main():
         sys.exit(0 if success else 1)
     
     # Main job tracking logic
-    print(f"\n{'='*60}")
+    settings = config.settings()
+    print(f"\n{BANNER_RULE}")
     print(f"🔍 LinkedIn Job Tracker")
-    print(f"{'='*60}")
+    print(BANNER_RULE)
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Searching for: {config.SEARCH_KEYWORDS}")
-    print(f"Locations: {', '.join(config.SEARCH_LOCATIONS)}")
-    print(f"Max age: {config.MAX_DAYS_OLD} days")
+    print(f"Searching for: {settings.SEARCH_KEYWORDS}")
+    print(f"Locations: {', '.join(settings.SEARCH_LOCATIONS)}")
+    print(f"Max age: {settings.MAX_DAYS_OLD} days")
     print()
     
     # Fetch jobs
     print("🌐 Fetching jobs from Adzuna API...")
-    jobs = fetcher.fetch_all_locations(
-        keywords=config.SEARCH_KEYWORDS,
-        locations=config.SEARCH_LOCATIONS,
-        max_days_old=config.MAX_DAYS_OLD
-    )
+    from src.core import JobFetcher
+    
+    with JobFetcher() as fetcher:
+        jobs = fetcher.fetch_all_locations(
+            keywords=settings.SEARCH_KEYWORDS,
+            locations=settings.SEARCH_LOCATIONS,
+            max_days_old=settings.MAX_DAYS_OLD
+        )
     
     if not jobs:
         print("\n⚠️  No jobs found. Possible issues:")
@@ -150,41 +188,42 @@ def main():
     
     # Filter for new jobs
     print(f"\n🔎 Checking for new jobs...")
-    new_jobs = []
+    new_ids = storage.filter_new_ids([job['id'] for job in jobs])
+    new_jobs = [job for job in jobs if job['id'] in new_ids]
     
-    for job in jobs:
-        if storage.is_new_job(job['id']):
-            new_jobs.append(job)
-            storage.add_job(job)
+    storage.add_jobs(new_jobs)
     
-    print(f"\n{'='*60}")
+    print(f"\n{BANNER_RULE}")
     print(f"📈 Results: Found {len(new_jobs)} new job(s)")
-    print(f"{'='*60}")
+    print(BANNER_RULE)
     
     # Send notifications
     if new_jobs:
         if args.check:
             print("\n📝 New jobs found (--check mode, not sending email):")
-            for job in new_jobs:
-                print(f"  • {job['title']} at {job['company']}")
-                print(f"    {job['url']}")
+            print("\n".join(
+                f"  • {job['title']} at {job['company']}\n    {job['url']}"
+                for job in new_jobs
+            ))
         else:
+            from src.core import EmailNotifier
+            
             print("\n📧 Sending email notification...")
-            success = notifier.send_notification(new_jobs)
+            with EmailNotifier() as notifier:
+                success = notifier.send_notification(new_jobs)
             
             if success:
                 # Mark jobs as notified
-                for job in new_jobs:
-                    storage.mark_as_notified(job['id'])
+                storage.mark_as_notified_many([job['id'] for job in new_jobs])
     else:
         print("\n✅ No new jobs to report (all jobs already seen)")
     
     # Summary
-    print(f"\n{'='*60}")
+    print(f"\n{BANNER_RULE}")
     print(f"✓ Job check complete")
     print(f"  Total jobs in database: {storage.get_job_count()}")
     print(f"  New jobs this run: {len(new_jobs)}")
-    print(f"{'='*60}\n")
+    print(f"{BANNER_RULE}\n")
 
 
 if __name__ == "__main__":
@@ -2,110 +2,265 @@
 """
 Simple database viewer - shows all jobs in your SQLite database.
 
+Requires Python 3.9+ (zoneinfo), the same minimum as the tracker.
+
 Usage:
-    python view_database.py              # View all jobs
+    python view_database.py              # View newest 100 jobs
+    python view_database.py --limit 0    # View all jobs
     python view_database.py --count      # Just show count
     python view_database.py --notified   # Show only notified jobs
     python view_database.py --new        # Show only un-notified jobs
+    python view_database.py --limit 20 --offset 20   # Show jobs 21-40
+    python view_database.py --after JOB_ID   # Next page, after the job shown last
 """
 
+import sys
+import atexit
 import sqlite3
-import argparse
-from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from datetime import datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+# US Eastern time, switching between EST and EDT with daylight saving, as in
+# the email notifier (src/core/notifier.py, not imported here to keep
+# smtplib/email out of the viewer's startup)
+EASTERN = ZoneInfo("America/New_York")
+EASTERN_FORMAT = '%m/%d/%Y - %I:%M %p %Z'
+UTC_FORMAT = '%H:%M UTC'
+
+# Columns for the job listing, in the order view_all_jobs() unpacks them.
+# Status and salary text are computed by SQLite rather than per row in Python.
+LISTING_COLUMNS = (
+    "title, company, location, posted_date, "
+    "CASE WHEN salary_min AND salary_max "
+    "THEN printf('   Salary: $%,d - $%,d\n', "
+    "CAST(round(salary_min) AS INTEGER), CAST(round(salary_max) AS INTEGER)) "
+    "ELSE '' END, "
+    "CASE WHEN notified THEN '✅ Emailed' ELSE '📝 Not emailed yet' END, "
+    "first_seen, url, job_id"
+)
+
+HEADER_RULE = "=" * 80
+JOB_RULE = "-" * 80
+
+# One job's block in the listing; posted_line and salary_line end in a
+# newline, or are empty when unknown
+JOB_TEMPLATE = (
+    "{i}. {title}\n"
+    "   Company: {company}\n"
+    "   Location: {location}\n"
+    "{posted_line}"
+    "{salary_line}"
+    "   Status: {status}\n"
+    "   Added to DB: {first_seen}\n"
+    "   URL: {url}\n"
+    "   ID: {job_id}\n"
+    "\n" + JOB_RULE + "\n\n"
+)
+
+# Total, emailed and not-yet-emailed counts in a single table scan
+COUNTS_QUERY = (
+    'SELECT COUNT(*), '
+    'COALESCE(SUM(notified = 1), 0), '
+    'COALESCE(SUM(notified = 0), 0) '
+    'FROM jobs'
+)
+
+# Jobs listed by default on the command line; --limit 0 lists all
+DEFAULT_LIMIT = 100
+
+# Rows fetched from SQLite at a time while listing
+FETCH_BATCH_SIZE = 512
 
 
+@lru_cache(maxsize=4096)
 def format_timestamp(timestamp_str):
-    """Convert ISO 8601 timestamp to readable format."""
+    """
+    Convert ISO 8601 timestamp to readable format in US Eastern time.
+    
+    Cached because jobs from the same fetch often share a posted timestamp.
+    """
     try:
         # Parse ISO 8601 timestamp (UTC)
-        dt_utc = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        
-        # Convert to EST (UTC-5)
-        dt_est = dt_utc - timedelta(hours=5)
+        if timestamp_str.endswith('Z'):
+            timestamp_str = timestamp_str[:-1] + '+00:00'
+        dt_utc = datetime.fromisoformat(timestamp_str)
+        if dt_utc.tzinfo is None:
+            dt_utc = dt_utc.replace(tzinfo=timezone.utc)
+        dt_eastern = dt_utc.astimezone(EASTERN)
         
-        # Format: 11/19/2025 - 09:51 AM EST (14:51 UTC)
-        date_str = dt_est.strftime('%m/%d/%Y')
-        time_12hr = dt_est.strftime('%I:%M %p')
-        time_24hr = dt_utc.strftime('%H:%M')
-        
-        return f"{date_str} - {time_12hr} EST ({time_24hr} UTC)"
+        # Format: 11/19/2025 - 09:51 AM EST (14:51 UTC), EDT in summer
+        return f"{dt_eastern.strftime(EASTERN_FORMAT)} ({dt_utc.strftime(UTC_FORMAT)})"
     except (ValueError, AttributeError):
         return timestamp_str
 
 
-def view_all_jobs(db_path='jobs.db', filter_type=None):
-    """Display all jobs in the database."""
+def open_database(db_path):
+    """
+    Open the jobs database read-only, tuned for the viewer's queries.
+    
+    Raises FileNotFoundError if the database doesn't exist, rather than
+    creating an empty one.
+    """
+    path = Path(db_path).absolute()
+    if not path.is_file():
+        raise FileNotFoundError(db_path)
+    
+    # mode=ro: no write locks or journal, so a running tracker isn't blocked
+    conn = sqlite3.connect(f'{path.as_uri()}?mode=ro', uri=True)
+    conn.executescript(
+        'PRAGMA query_only = 1;'
+        'PRAGMA cache_size = -20000;'
+        'PRAGMA temp_store = MEMORY;'
+        'PRAGMA mmap_size = 268435456;'
+    )
+    return conn
+
+
+# Open connections by database path, shared by every viewer call
+_connections = {}
+
+
+def get_connection(db_path):
+    """Return the shared connection for db_path, opening it on first use."""
+    conn = _connections.get(db_path)
+    if conn is None:
+        conn = _connections[db_path] = open_database(db_path)
+    return conn
+
+
+@atexit.register
+def close_connections():
+    """Close all shared connections."""
+    for conn in _connections.values():
+        conn.close()
+    _connections.clear()
+
+
+def iter_rows(cursor, batch_size=FETCH_BATCH_SIZE):
+    """Yield a cursor's rows, fetching them in batches rather than all at once."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def view_all_jobs(db_path='jobs.db', filter_type=None, limit=None, offset=0, after=None):
+    """
+    Display jobs in the database, newest postings first.
+    
+    Args:
+        db_path: Path to database file
+        filter_type: 'notified' or 'new' to show only those jobs
+        limit: Maximum number of jobs to show (None or 0 for all)
+        offset: Number of jobs to skip before the first one shown
+        after: Job ID to continue from; lists only the jobs that come after
+            it in the listing order (keyset paging, no rows skipped via OFFSET)
+    """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = get_connection(db_path).cursor()
+        
+        conditions = []
+        params = []
+        if after:
+            cursor.execute(
+                'SELECT posted_date, first_seen, job_id FROM jobs WHERE job_id = ?',
+                (after,)
+            )
+            after_key = cursor.fetchone()
+            if after_key is None:
+                print(f"\n❌ No job with ID {after} in database.\n")
+                return
+            # Same key as the ORDER BY below, so this is a seek, not a skip
+            conditions.append('(posted_date, first_seen, job_id) < (?, ?, ?)')
+            params.extend(after_key)
+        
+        # Counted up front, so rows can be streamed after the header. The
+        # counts cover the same range as the listing.
+        range_where = f"WHERE {conditions[0]}" if after else ''
+        cursor.execute(f'{COUNTS_QUERY} {range_where}', params)
+        total_count, notified_count, new_count = cursor.fetchone()
         
         # Build query based on filter
         if filter_type == 'notified':
-            query = 'SELECT * FROM jobs WHERE notified = 1 ORDER BY first_seen DESC'
+            conditions.append('notified = 1')
+            listed_count = notified_count
         elif filter_type == 'new':
-            query = 'SELECT * FROM jobs WHERE notified = 0 ORDER BY first_seen DESC'
+            conditions.append('notified = 0')
+            listed_count = new_count
         else:
-            query = 'SELECT * FROM jobs ORDER BY first_seen DESC'
-        
-        cursor.execute(query)
-        jobs = cursor.fetchall()
+            listed_count = total_count
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ''
         
-        if not jobs:
+        if not listed_count and after:
+            print(f"\n📭 No more jobs after {after}.\n")
+            return
+        if not listed_count:
             print("\n📭 No jobs found in database.")
             print("Run the tracker first: python -m src.runners.local\n")
             return
         
-        # Sort jobs by posted_date (newest first)
-        jobs_list = [dict(job) for job in jobs]
-        jobs_sorted = sorted(
-            jobs_list,
-            key=lambda x: x.get('posted_date', ''),
-            reverse=True
+        # Newest postings first; ties keep the most recently added first, and
+        # job_id makes the order total so --after can resume from any row
+        query = (
+            f'SELECT {LISTING_COLUMNS} FROM jobs {where}'
+            'ORDER BY posted_date DESC, first_seen DESC, job_id DESC '
+            'LIMIT ? OFFSET ?'
         )
+        # LIMIT -1 means no limit to SQLite
+        cursor.execute(query, params + [limit or -1, offset])
         
-        print(f"\n{'='*80}")
-        print(f"📊 DATABASE CONTENTS: {len(jobs_sorted)} job(s)")
-        print(f"{'='*80}\n")
+        shown_count = max(listed_count - offset, 0)
+        if limit:
+            shown_count = min(shown_count, limit)
         
-        for i, job in enumerate(jobs_sorted, 1):
-            notified_status = "✅ Emailed" if job['notified'] else "📝 Not emailed yet"
-            
-            print(f"{i}. {job['title']}")
-            print(f"   Company: {job['company']}")
-            print(f"   Location: {job['location']}")
-            
+        print(f"\n{HEADER_RULE}")
+        if after:
+            print(f"📊 DATABASE CONTENTS: {listed_count} job(s) after {after}")
+        else:
+            print(f"📊 DATABASE CONTENTS: {listed_count} job(s)")
+        if shown_count < listed_count:
+            if shown_count:
+                print(f"   Showing {offset + 1}-{offset + shown_count} (see --limit / --after)")
+            else:
+                print(f"   No jobs past offset {offset}")
+        print(f"{HEADER_RULE}\n")
+        
+        # One write per job rather than a print() per line
+        write = sys.stdout.write
+        format_job = JOB_TEMPLATE.format
+        for i, (
+            title, company, location, posted_date, 
+            salary_line, status, first_seen, url, job_id
+        ) in enumerate(iter_rows(cursor), offset + 1):
             # Format posted date
-            if job['posted_date']:
-                formatted_posted = format_timestamp(job['posted_date'])
-                print(f"   Posted: {formatted_posted}")
+            if posted_date:
+                posted_line = f"   Posted: {format_timestamp(posted_date)}\n"
+            else:
+                posted_line = ""
             
-            # Show salary if available
-            if job['salary_min'] and job['salary_max']:
-                print(f"   Salary: ${job['salary_min']:,.0f} - ${job['salary_max']:,.0f}")
-            
-            print(f"   Status: {notified_status}")
-            print(f"   Added to DB: {job['first_seen']}")
-            print(f"   URL: {job['url']}")
-            print(f"   ID: {job['job_id']}")
-            print()
-            print("-" * 80)
-            print()
+            write(format_job(
+                i=i, title=title, company=company, location=location, 
+                posted_line=posted_line, salary_line=salary_line, status=status, 
+                first_seen=first_seen, url=url, job_id=job_id
+            ))
         
-        # Summary
-        cursor.execute('SELECT COUNT(*) FROM jobs WHERE notified = 1')
-        notified_count = cursor.fetchone()[0]
-        cursor.execute('SELECT COUNT(*) FROM jobs WHERE notified = 0')
-        new_count = cursor.fetchone()[0]
+        if shown_count and offset + shown_count < listed_count:
+            print(f"➡️  More jobs: add --after {job_id} for the next page\n")
         
-        print(f"📈 SUMMARY:")
-        print(f"   Total jobs: {len(jobs)}")
+        # Summary
+        if after:
+            print(f"📈 SUMMARY (jobs after {after}):")
+        else:
+            print(f"📈 SUMMARY:")
+        print(f"   Total jobs: {listed_count}")
         print(f"   Emailed: {notified_count}")
         print(f"   Not yet emailed: {new_count}")
         print()
         
-        conn.close()
-        
     except sqlite3.Error as e:
         print(f"❌ Database error: {e}")
     except FileNotFoundError:
@@ -116,30 +271,33 @@ def view_all_jobs(db_path='jobs.db', filter_type=None):
 def show_count(db_path='jobs.db'):
     """Just show the count of jobs."""
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*) FROM jobs')
-        total = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM jobs WHERE notified = 1')
-        notified = cursor.fetchone()[0]
+        cursor = get_connection(db_path).cursor()
         
-        cursor.execute('SELECT COUNT(*) FROM jobs WHERE notified = 0')
-        new = cursor.fetchone()[0]
+        cursor.execute(COUNTS_QUERY)
+        total, notified, new = cursor.fetchone()
         
         print(f"\n📊 Database Statistics:")
         print(f"   Total jobs: {total}")
         print(f"   Emailed: {notified}")
         print(f"   Not yet emailed: {new}\n")
         
-        conn.close()
-        
     except sqlite3.Error as e:
         print(f"❌ Database error: {e}")
+    except FileNotFoundError:
+        print(f"❌ Database file not found: {db_path}")
+        print("Run the tracker first: python -m src.runners.local")
 
 
-if __name__ == "__main__":
+def parse_args():
+    """Parse CLI arguments, skipping argparse entirely when there are none."""
+    if len(sys.argv) == 1:
+        return SimpleNamespace(
+            count=False, notified=False, new=False, 
+            limit=DEFAULT_LIMIT, offset=0, after=None, db='jobs.db'
+        )
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='View jobs in your SQLite database'
     )
@@ -158,6 +316,23 @@ if __name__ == "__main__":
         action='store_true',
         help='Show only jobs that have NOT been emailed'
     )
+    parser.add_argument(
+        '--limit',
+        type=int,
+        default=DEFAULT_LIMIT,
+        help=f'Maximum number of jobs to list (default: {DEFAULT_LIMIT}, 0 for all)'
+    )
+    parser.add_argument(
+        '--offset',
+        type=int,
+        default=0,
+        help='Number of jobs to skip before listing'
+    )
+    parser.add_argument(
+        '--after',
+        metavar='JOB_ID',
+        help='List the jobs that come after JOB_ID (e.g. the last one shown)'
+    )
     parser.add_argument(
         '--db',
         default='jobs.db',
@@ -165,13 +340,22 @@ if __name__ == "__main__":
     )
     
     args = parser.parse_args()
+    if args.limit < 0 or args.offset < 0:
+        parser.error('--limit and --offset must not be negative')
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    
+    page = dict(limit=args.limit, offset=args.offset, after=args.after)
     
     if args.count:
         show_count(args.db)
     elif args.notified:
-        view_all_jobs(args.db, filter_type='notified')
+        view_all_jobs(args.db, filter_type='notified', **page)
     elif args.new:
-        view_all_jobs(args.db, filter_type='new')
+        view_all_jobs(args.db, filter_type='new', **page)
     else:
-        view_all_jobs(args.db)
+        view_all_jobs(args.db, **page)
 